@@ -42,37 +42,23 @@ def resolve_rendercv_file_path(
         "MONTH_IN_TWO_DIGITS": f"{current_date.month:02d}",
         "YEAR": str(current_date.year),
         "YEAR_IN_TWO_DIGITS": str(current_date.year)[-2:],
-        "NAME": rendercv_model.cv.name,
-        "NAME_IN_SNAKE_CASE": (
-            rendercv_model.cv.name.replace(" ", "_") if rendercv_model.cv.name else None
-        ),
-        "NAME_IN_LOWER_SNAKE_CASE": (
-            rendercv_model.cv.name.replace(" ", "_").lower()
-            if rendercv_model.cv.name
-            else None
-        ),
-        "NAME_IN_UPPER_SNAKE_CASE": (
-            rendercv_model.cv.name.replace(" ", "_").upper()
-            if rendercv_model.cv.name
-            else None
-        ),
-        "NAME_IN_KEBAB_CASE": (
-            rendercv_model.cv.name.replace(" ", "-") if rendercv_model.cv.name else None
-        ),
-        "NAME_IN_LOWER_KEBAB_CASE": (
-            rendercv_model.cv.name.replace(" ", "-").lower()
-            if rendercv_model.cv.name
-            else None
-        ),
-        "NAME_IN_UPPER_KEBAB_CASE": (
-            rendercv_model.cv.name.replace(" ", "-").upper()
-            if rendercv_model.cv.name
-            else None
-        ),
-    }
-    file_path_placeholders = {
-        k: v for k, v in file_path_placeholders.items() if v is not None
     }
+    name = rendercv_model.cv.name
+    if name is not None:
+        file_path_placeholders["NAME"] = name
+    if name:
+        snake_case_name = name.replace(" ", "_")
+        kebab_case_name = name.replace(" ", "-")
+        file_path_placeholders.update(
+            {
+                "NAME_IN_SNAKE_CASE": snake_case_name,
+                "NAME_IN_LOWER_SNAKE_CASE": snake_case_name.lower(),
+                "NAME_IN_UPPER_SNAKE_CASE": snake_case_name.upper(),
+                "NAME_IN_KEBAB_CASE": kebab_case_name,
+                "NAME_IN_LOWER_KEBAB_CASE": kebab_case_name.lower(),
+                "NAME_IN_UPPER_KEBAB_CASE": kebab_case_name.upper(),
+            }
+        )
     file_name = substitute_placeholders(file_path.name, file_path_placeholders)
     resolved_file_path = file_path.parent / file_name
     resolved_file_path.parent.mkdir(parents=True, exist_ok=True)
@@ -10,6 +10,8 @@ from .footer_and_top_note import render_footer_template, render_top_note_templat
 from .markdown_parser import markdown_to_typst
 from .string_processor import apply_string_processors, make_keywords_bold
 
+unprocessed_entry_fields = frozenset({"start_date", "end_date", "doi", "url"})
+
 
 def process_model(
     rendercv_model: RenderCVModel, file_type: Literal["typst", "markdown"]
@@ -100,14 +102,12 @@ def process_fields(
     Returns:
         Entry with processed fields.
     """
-    skipped = {"start_date", "end_date", "doi", "url"}
-
     if isinstance(entry, str):
         return apply_string_processors(entry, string_processors)
 
     data = entry.model_dump(exclude_none=True)
     for field, value in data.items():
-        if field in skipped or field.startswith("_"):
+        if field in unprocessed_entry_fields or field.startswith("_"):
             continue
 
         if isinstance(value, str):
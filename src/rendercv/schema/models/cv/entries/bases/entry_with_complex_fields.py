@@ -1,4 +1,3 @@
-import re
 from datetime import date as Date
 from typing import Annotated, Literal, Self
 
@@ -9,7 +8,7 @@ from rendercv.exception import RenderCVInternalError
 
 from .....pydantic_error_handling import CustomPydanticErrorTypes
 from ....validation_context import get_current_date
-from .entry_with_date import BaseEntryWithDate
+from .entry_with_date import BaseEntryWithDate, exact_date_pattern
 
 
 def validate_exact_date(date: str | int) -> str | int:
@@ -66,15 +65,10 @@ def get_date_object(date: str | int, current_date: Date | None = None) -> Date:
     """
     if isinstance(date, int):
         date_object = Date.fromisoformat(f"{date}-01-01")
-    elif re.fullmatch(r"\d{4}-\d{2}-\d{2}", date):
-        # Then it is in YYYY-MM-DD format
-        date_object = Date.fromisoformat(date)
-    elif re.fullmatch(r"\d{4}-\d{2}", date):
-        # Then it is in YYYY-MM format
-        date_object = Date.fromisoformat(f"{date}-01")
-    elif re.fullmatch(r"\d{4}", date):
-        # Then it is in YYYY format
-        date_object = Date.fromisoformat(f"{date}-01-01")
+    elif match := exact_date_pattern.fullmatch(date):
+        # Then it is in YYYY-MM-DD, YYYY-MM, or YYYY format
+        year, month, day = match.groups()
+        date_object = Date.fromisoformat(f"{year}-{month or '01'}-{day or '01'}")
     elif date == "present":
         if current_date is None:
             raise RenderCVInternalError(
@@ -6,6 +6,9 @@ import pydantic
 
 from .entry import BaseEntry
 
+# Matches YYYY, YYYY-MM, and YYYY-MM-DD, capturing year, month, and day:
+exact_date_pattern = re.compile(r"(\d{4})(?:-(\d{2})(?:-(\d{2}))?)?")
+
 
 def validate_arbitrary_date(date: int | str) -> int | str:
     """Validate date format while allowing flexible user input.
@@ -21,12 +24,11 @@ def validate_arbitrary_date(date: int | str) -> int | str:
     Returns:
         Original date if valid.
     """
-    date_str = str(date)
+    match = exact_date_pattern.fullmatch(str(date))
 
-    if re.fullmatch(r"\d{4}-\d{2}-\d{2}", date_str):
-        Date.fromisoformat(date_str)
-    elif re.fullmatch(r"\d{4}-\d{2}", date_str):
-        Date.fromisoformat(f"{date_str}-01")
+    if match and match.group(2):
+        year, month, day = match.groups()
+        Date.fromisoformat(f"{year}-{month}-{day or '01'}")
 
     return date
 
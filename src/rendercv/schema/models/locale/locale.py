@@ -6,7 +6,7 @@ from typing import Annotated, get_args
 import pydantic
 
 from ...variant_pydantic_model_generator import create_variant_pydantic_model
-from ...yaml_reader import read_yaml
+from ...yaml_reader import read_bundled_yaml
 from .english_locale import EnglishLocale
 
 
@@ -27,7 +27,7 @@ def discover_other_locales() -> list[type[EnglishLocale]]:
     for yaml_file in sorted(other_locales_dir.glob("*.yaml")):
         locale_model = create_variant_pydantic_model(
             variant_name=yaml_file.stem,
-            defaults=read_yaml(yaml_file)["locale"],
+            defaults=read_bundled_yaml(yaml_file)["locale"],
             base_class=EnglishLocale,
             discriminator_field="language",
             class_name_suffix="Locale",
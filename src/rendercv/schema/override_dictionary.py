@@ -111,8 +111,36 @@ def apply_overrides_to_dictionary[T: dict](
     Returns:
         Deep copy with all overrides applied.
     """
-    new_dictionary = copy.deepcopy(dictionary)
+    return apply_overrides_to_dictionary_in_place(copy.deepcopy(dictionary), overrides)
+
+
+def apply_overrides_to_dictionary_in_place[T: dict](
+    dictionary: T,
+    overrides: dict[str, str],
+) -> T:
+    """Apply multiple CLI overrides to dictionary without copying it.
+
+    Why:
+        When the caller owns a freshly parsed dictionary, deep-copying it before
+        applying overrides duplicates the whole input for nothing. Mutating in
+        place skips that copy.
+
+    Example:
+        ```py
+        data = {"cv": {"name": "John"}}
+        result = apply_overrides_to_dictionary_in_place(data, {"cv.name": "Jane"})
+        assert result is data
+        assert data["cv"]["name"] == "Jane"
+        ```
+
+    Args:
+        dictionary: Dictionary to modify.
+        overrides: Map of dotted paths to new values.
+
+    Returns:
+        The same dictionary with all overrides applied.
+    """
     for key, value in overrides.items():
-        new_dictionary = update_value_by_location(new_dictionary, key, value, key)
+        dictionary = update_value_by_location(dictionary, key, value, key)
 
-    return new_dictionary
+    return dictionary
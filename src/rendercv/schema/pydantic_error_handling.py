@@ -8,11 +8,11 @@ from ruamel.yaml.comments import CommentedMap
 from rendercv.exception import RenderCVInternalError, RenderCVValidationError
 
 from .models.custom_error_types import CustomPydanticErrorTypes
-from .yaml_reader import read_yaml
+from .yaml_reader import read_bundled_yaml
 
 error_dictionary = cast(
     dict[str, str],
-    read_yaml(pathlib.Path(__file__).parent / "error_dictionary.yaml"),
+    read_bundled_yaml(pathlib.Path(__file__).parent / "error_dictionary.yaml"),
 )
 unwanted_texts = ("value is not a valid email address: ", "Value error, ")
 unwanted_locations = (
@@ -8,7 +8,7 @@ from rendercv.exception import RenderCVUserValidationError
 
 from .models.rendercv_model import RenderCVModel
 from .models.validation_context import ValidationContext
-from .override_dictionary import apply_overrides_to_dictionary
+from .override_dictionary import apply_overrides_to_dictionary_in_place
 from .pydantic_error_handling import parse_validation_errors
 from .yaml_reader import read_yaml
 
@@ -95,7 +95,8 @@ def build_rendercv_dictionary(
 
     overrides = kwargs.get("overrides")
     if overrides:
-        input_dict = apply_overrides_to_dictionary(input_dict, overrides)
+        # `input_dict` was parsed above and isn't shared, so no need to copy it:
+        input_dict = apply_overrides_to_dictionary_in_place(input_dict, overrides)
 
     return input_dict
 
@@ -1,5 +1,5 @@
+import functools
 import io
-import json
 import pathlib
 import re
 from typing import overload
@@ -16,19 +16,17 @@ from .models.rendercv_model import RenderCVModel
 from .rendercv_model_builder import read_yaml
 
 
-def dictionary_to_yaml(dictionary: dict) -> str:
-    """Convert dictionary to formatted YAML string with multiline preservation.
+@functools.lru_cache(maxsize=1)
+def get_yaml_dumper() -> ruamel.yaml.YAML:
+    """Create cached YAML dumper that writes multiline strings in pipe syntax.
 
     Why:
-        Sample YAML generation must produce readable output with proper
-        formatting for multiline strings. Custom representer ensures
-        bullet points and descriptions use pipe syntax.
-
-    Args:
-        dictionary: Data structure to convert.
+        Sample generation dumps YAML for every theme and locale. Configuring the
+        emitter and registering the representer once avoids rebuilding the same
+        YAML instance on each call.
 
     Returns:
-        Formatted YAML string.
+        Configured YAML instance.
     """
 
     # Source: https://gist.github.com/alertedsnake/c521bc485b3805aa3839aef29e39f376
@@ -42,9 +40,25 @@ def dictionary_to_yaml(dictionary: dict) -> str:
     yaml_object.width = 9999
     yaml_object.indent(mapping=2, sequence=4, offset=2)
     yaml_object.representer.add_representer(str, str_representer)
+    return yaml_object
+
+
+def dictionary_to_yaml(dictionary: dict) -> str:
+    """Convert dictionary to formatted YAML string with multiline preservation.
+
+    Why:
+        Sample YAML generation must produce readable output with proper
+        formatting for multiline strings. Custom representer ensures
+        bullet points and descriptions use pipe syntax.
 
+    Args:
+        dictionary: Data structure to convert.
+
+    Returns:
+        Formatted YAML string.
+    """
     with io.StringIO() as string_stream:
-        yaml_object.dump(dictionary, string_stream)
+        get_yaml_dumper().dump(dictionary, string_stream)
         return string_stream.getvalue()
 
 
@@ -144,9 +158,10 @@ def create_sample_yaml_input_file(
         name=name, theme=theme, locale=locale
     )
 
-    # Instead of getting the dictionary with data_model.model_dump() directly, we
-    # convert it to JSON and then to a dictionary. Because the YAML library we are
-    # using sometimes has problems with the dictionary returned by model_dump().
+    # We dump in JSON mode because the YAML library we are using has problems with
+    # some of the Python objects returned by a plain model_dump() (e.g., dates and
+    # URLs). JSON mode gives JSON-compatible values without serializing to a JSON
+    # string and parsing it back.
 
     # We exclude "cv.sections" because the data model automatically generates them.
     # The user's "cv.sections" input is actually "cv.sections_input" in the data
@@ -156,11 +171,11 @@ def create_sample_yaml_input_file(
     # automatically generated from "cv.sections_input" to make the templating
     # process easier. "cv.sections_input" exists for the convenience of the user.
     # Also, we don't want to show the cv.photo field in the Web app.
-    data_model_as_json = data_model.model_dump_json(
+    data_model_as_dictionary = data_model.model_dump(
+        mode="json",
         exclude_none=False,
         by_alias=True,
     )
-    data_model_as_dictionary = json.loads(data_model_as_json)
 
     yaml_string = dictionary_to_yaml(data_model_as_dictionary)
 
@@ -1,8 +1,10 @@
 import pathlib
+from typing import Any
 
 import ruamel.yaml
 import ruamel.yaml.scanner
 from ruamel.yaml.comments import CommentedMap
+from ruamel.yaml.constructor import SafeConstructor
 from ruamel.yaml.scanner import RoundTripScanner
 
 from rendercv.exception import RenderCVInternalError, RenderCVUserError
@@ -67,6 +69,31 @@ def read_yaml(file_path_or_contents: pathlib.Path | str) -> CommentedMap:
     return yaml_as_dictionary
 
 
+def read_bundled_yaml(file_path: pathlib.Path) -> dict[str, Any]:
+    """Parse a YAML file shipped with RenderCV into plain Python objects.
+
+    Why:
+        Built-in themes, locales, and the error dictionary are parsed at import
+        time and never produce user-facing validation errors, so they don't need
+        the line/column metadata `read_yaml` keeps. The safe loader skips
+        building `CommentedMap` wrappers, while treating `*` and ISO dates the
+        same way `read_yaml` does.
+
+    Example:
+        ```py
+        data = read_bundled_yaml(pathlib.Path("other_locales/turkish.yaml"))
+        language = data["locale"]["language"]
+        ```
+
+    Args:
+        file_path: Path to a YAML file inside the RenderCV package.
+
+    Returns:
+        Plain dictionary with the file's contents.
+    """
+    return safe_yaml.load(file_path.read_text(encoding="utf-8"))
+
+
 class ScannerNoAlias(RoundTripScanner):
     """Custom Scanner that treats * as a regular character instead of alias syntax."""
 
@@ -76,11 +103,34 @@ class ScannerNoAlias(RoundTripScanner):
         self.fetch_plain()
 
 
+class SafeScannerNoAlias(ruamel.yaml.scanner.Scanner):
+    """Safe-loader Scanner that treats * as a regular character like `ScannerNoAlias`."""
+
+    fetch_alias = ScannerNoAlias.fetch_alias
+
+
+class SafeConstructorNoTimestamp(SafeConstructor):
+    """Safe-loader Constructor that keeps ISO dates as strings like `read_yaml`."""
+
+
+def construct_timestamp_as_string(loader, node):
+    """Construct an ISO date/timestamp node as its plain string value."""
+    return loader.construct_scalar(node)
+
+
 # Monkey-patch the RoundTripScanner to treat * as a regular character:
 ruamel.yaml.scanner.RoundTripScanner = ScannerNoAlias  # ty: ignore[invalid-assignment]
 yaml = ruamel.yaml.YAML()
 
 # Disable ISO date parsing, keep it as a string:
 yaml.constructor.yaml_constructors["tag:yaml.org,2002:timestamp"] = (
-    lambda loader, node: loader.construct_scalar(node)
+    construct_timestamp_as_string
 )
+SafeConstructorNoTimestamp.add_constructor(
+    "tag:yaml.org,2002:timestamp", construct_timestamp_as_string
+)
+
+# The pure-Python safe loader is needed for the custom Scanner to take effect:
+safe_yaml = ruamel.yaml.YAML(typ="safe", pure=True)
+safe_yaml.Scanner = SafeScannerNoAlias
+safe_yaml.Constructor = SafeConstructorNoTimestamp
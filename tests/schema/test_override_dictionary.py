@@ -5,6 +5,7 @@ import pytest
 from rendercv.exception import RenderCVUserError
 from rendercv.schema.override_dictionary import (
     apply_overrides_to_dictionary,
+    apply_overrides_to_dictionary_in_place,
     update_value_by_location,
 )
 
@@ -263,3 +264,22 @@ class TestApplyOverridesToDictionary:
         assert result["cv"]["sections"]["experience"][0]["company"] == "Meta"
         assert result["cv"]["sections"]["experience"][0]["title"] == "Engineer"
         assert initial["cv"]["name"] == "John Doe"
+
+
+class TestApplyOverridesToDictionaryInPlace:
+    def test_mutates_original(self):
+        original = {"cv": {"name": "John", "sections": {"education": ["MIT"]}}}
+        overrides = {"cv.name": "Jane", "cv.sections.education.0": "Harvard"}
+
+        result = apply_overrides_to_dictionary_in_place(original, overrides)
+
+        assert result is original
+        assert original == {
+            "cv": {"name": "Jane", "sections": {"education": ["Harvard"]}}
+        }
+
+    def test_empty_overrides(self):
+        original = {"name": "John"}
+        result = apply_overrides_to_dictionary_in_place(original, {})
+        assert result is original
+        assert result == {"name": "John"}
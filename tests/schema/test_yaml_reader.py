@@ -4,7 +4,12 @@ import pytest
 from ruamel.yaml.comments import CommentedMap
 
 from rendercv.exception import RenderCVInternalError, RenderCVUserError
-from rendercv.schema.yaml_reader import read_yaml
+from rendercv.schema.yaml_reader import read_bundled_yaml, read_yaml
+
+schema_directory = (
+    pathlib.Path(__file__).parent.parent.parent / "src" / "rendercv" / "schema"
+)
+bundled_yaml_files = sorted(schema_directory.rglob("*.yaml"))
 
 
 class TestReadYaml:
@@ -36,3 +41,38 @@ class TestReadYaml:
 
         with pytest.raises(RenderCVUserError, match="empty"):
             read_yaml(empty_file_path)
+
+
+class TestReadBundledYaml:
+    def test_returns_plain_python_objects(self, tmp_path: pathlib.Path):
+        file_path = tmp_path / "bundled.yaml"
+        file_path.write_text("locale:\n  language: xx\n  months: [a, b]\n")
+
+        data = read_bundled_yaml(file_path)
+
+        assert data == {"locale": {"language": "xx", "months": ["a", "b"]}}
+        assert type(data) is dict
+        assert type(data["locale"]["months"]) is list
+
+    @pytest.mark.parametrize(
+        ("contents", "expected"),
+        [
+            ("value: *DEGREE* in AREA", "*DEGREE* in AREA"),
+            ("value: 2024-01-01", "2024-01-01"),
+            ("value: 2024-01-01T10:00:00", "2024-01-01T10:00:00"),
+        ],
+    )
+    def test_matches_read_yaml_scalars(
+        self, tmp_path: pathlib.Path, contents: str, expected: str
+    ):
+        file_path = tmp_path / "bundled.yaml"
+        file_path.write_text(contents, encoding="utf-8")
+
+        assert read_bundled_yaml(file_path) == {"value": expected}
+        assert read_yaml(file_path) == {"value": expected}
+
+    @pytest.mark.parametrize(
+        "file_path", bundled_yaml_files, ids=lambda file_path: file_path.name
+    )
+    def test_bundled_files_match_read_yaml(self, file_path: pathlib.Path):
+        assert read_bundled_yaml(file_path) == read_yaml(file_path)